@@ -9,8 +9,10 @@ import sys
 import os
 import signal
 import inspect
-import re
+import io
+import tokenize
 import platform
+import functools
 
 
 class Colors:
@@ -52,10 +54,35 @@ class Cursor:
     @staticmethod
     def clear_screen():
         """Clear the entire terminal screen"""
-        if os.name == "nt":
-            os.system("cls")
-        else:
-            os.system("clear")
+        sys.stdout.write("\033[H\033[2J")
+        sys.stdout.flush()
+
+    @staticmethod
+    def enable_ansi():
+        """Enable ANSI escape sequence processing (Windows 10+ consoles)"""
+        if os.name != "nt":
+            return
+        try:
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_uint32()
+            if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+                kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+        except (OSError, AttributeError):
+            pass
+
+
+def write_raw(data):
+    """Write pre-encoded bytes straight to the stdout file descriptor"""
+    # Anything still buffered in sys.stdout has to reach the terminal first
+    sys.stdout.flush()
+    fd = sys.stdout.fileno()
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
 
 
 class ASCIIClock:
@@ -64,10 +91,17 @@ class ASCIIClock:
     def __init__(self):
         """Initialize the ASCII clock with default parameters"""
         self.source_code = ""
-        self.grid = []
+        self._cached_source = None
+        self.grid = b""
         self.width = 0
         self.height = 0
+        self.time_start_row = 0
+        self.time_start_col = 0
+        self._drawn_time = None
+        self._fragments = {}
         self.terminal_resized = True
+        self._term_size = None
+        self._last_size = None
         self.min_width = 100  # Increased for better spacing
         self.min_height = 25  # Minimum height for proper display
         self.supports_resize_signal = False
@@ -96,9 +130,14 @@ class ASCIIClock:
     def _handle_resize(self, signum, frame):
         """Handle terminal resize signal (Unix/Linux/macOS only)"""
         self.terminal_resized = True
+        self._term_size = None
 
     def get_minified_source(self):
         """Get the current program's source code in minified form without docstrings"""
+        # The source never changes at runtime, so it is only built once
+        if self._cached_source is not None:
+            return self._cached_source
+
         current_file = __file__
         try:
             with open(current_file, "r", encoding="utf-8") as f:
@@ -123,29 +162,68 @@ class ASCIIClock:
         minified = " ".join(minified_lines)
 
         # Ensure sufficient length for ASCII art
-        while len(minified) < 20000:
-            minified += " " + minified
+        if minified:
+            repeats = -(-20000 // (len(minified) + 1))
+            minified = (minified + " ") * repeats
 
+        self._cached_source = minified
         return minified
 
     def _remove_docstrings_and_comments(self, source):
         """Remove docstrings and comments from Python source code"""
-        # Remove single-line comments
-        source = re.sub(r"#.*$", "", source, flags=re.MULTILINE)
-
-        # Remove multi-line docstrings (triple quotes)
-        # Pattern to match triple-quoted strings (both """ and ''')
-        docstring_pattern = r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\''
-        source = re.sub(docstring_pattern, "", source)
+        lines = io.StringIO(source).readlines()
+        line_starts = [0]
+        for line in lines:
+            line_starts.append(line_starts[-1] + len(line))
 
-        # Remove single-line docstrings
-        source = re.sub(r'^\s*""".*?"""\s*$', "", source, flags=re.MULTILINE)
-        source = re.sub(r"^\s*\'\'\'.*?\'\'\'\s*$", "", source, flags=re.MULTILINE)
+        def span(token):
+            (start_row, start_col), (end_row, end_col) = token.start, token.end
+            return (
+                line_starts[start_row - 1] + start_col,
+                line_starts[end_row - 1] + end_col,
+            )
 
-        return source
+        # Docstrings are string tokens that make up a whole statement
+        statement_start = (tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT)
+        removed = []
+        previous = tokenize.NEWLINE
+        docstring = None
+        try:
+            for token in tokenize.generate_tokens(io.StringIO(source).readline):
+                if token.type == tokenize.COMMENT:
+                    removed.append(span(token))
+                    continue
+                if token.type == tokenize.NL:
+                    continue
+
+                if docstring is not None:
+                    if token.type in (tokenize.NEWLINE, tokenize.ENDMARKER):
+                        removed.append(docstring)
+                    docstring = None
+                if token.type == tokenize.STRING and previous in statement_start:
+                    docstring = span(token)
+                previous = token.type
+        except (tokenize.TokenError, SyntaxError):
+            return source
+
+        # Keep everything between the removed spans
+        parts = []
+        position = 0
+        for start, end in sorted(removed):
+            parts.append(source[position:start])
+            position = end
+        parts.append(source[position:])
+
+        return "".join(parts)
 
     def get_terminal_size(self):
-        """Get current terminal dimensions with fallback"""
+        """Get current terminal dimensions, cached until the terminal is resized"""
+        if self._term_size is None:
+            self._term_size = self._query_terminal_size()
+        return self._term_size
+
+    def _query_terminal_size(self):
+        """Query current terminal dimensions with fallback"""
         try:
             if self.os_info["is_windows"]:
                 # For Windows, try multiple methods
@@ -181,32 +259,82 @@ class ASCIIClock:
     def update_display_parameters(self):
         """Update display parameters based on terminal size"""
         cols, lines = self.get_terminal_size()
+        self._last_size = (cols, lines)
 
         # Use full terminal size with minimal padding
         self.width = cols - 2
         self.height = lines - 2
 
-        # Update source code and grid
+        # Calculate center position for time display with improved spacing
+        time_width = 8 * 12 - 3  # 8 characters * 12 spacing - 3 for better centering
+        self.time_start_row = max(1, self.height // 2 - 5)
+        self.time_start_col = max(5, (self.width - time_width) // 2)
+
+        # Update source code and grid, previously rendered glyphs are stale now
         self.source_code = self.get_minified_source()
         self.grid = self.create_display_grid()
+        self._drawn_time = None
+        self._fragments = {}
 
     def create_display_grid(self):
-        """Create display grid filled with source code"""
-        grid = []
-        char_index = 0
+        """Create display grid filled with source code, stored row-major as bytes"""
+        source = self.source_code.encode("ascii", "replace")
+        size = self.width * self.height
+        if not source or size <= 0:
+            return b""
+
+        return (source * (size // len(source) + 1))[:size]
+
+    def draw_time(self, time_str):
+        """Draw the clock, repainting only the glyphs that changed since last draw"""
+        if self._drawn_time is None:
+            overlay = build_overlay(
+                time_str,
+                self.time_start_row,
+                self.time_start_col,
+                self.width,
+                self.height,
+            )
+            display_code_with_time(self, overlay)
+        else:
+            parts = [
+                self._get_glyph_fragment(slot, char)
+                for slot, (char, drawn) in enumerate(zip(time_str, self._drawn_time))
+                if char != drawn
+            ]
+            write_raw(b"".join(parts))
 
-        for row in range(self.height):
-            grid_row = []
-            for col in range(self.width):
-                if char_index < len(self.source_code):
-                    grid_row.append(self.source_code[char_index])
-                    char_index += 1
-                else:
-                    char_index = 0
-                    grid_row.append(self.source_code[char_index])
-            grid.append(grid_row)
+        self._drawn_time = time_str
 
-        return grid
+    def _get_glyph_fragment(self, slot, char):
+        """Get the escape sequence repainting one glyph slot, including its border"""
+        key = (slot, char)
+        fragment = self._fragments.get(key)
+        if fragment is not None:
+            return fragment
+
+        start_col = self.time_start_col + slot * 12
+        overlay = dict(
+            _place_glyph(
+                char, slot, self.time_start_row, start_col, self.width, self.height
+            )
+        )
+
+        # Repaint the glyph's bounding box so pixels of the old glyph are cleared
+        first_row = max(0, self.time_start_row - 1)
+        last_row = min(self.height, self.time_start_row + 12)
+        first_col = max(0, start_col - 1)
+        last_col = min(self.width, start_col + 10)
+
+        fragment = bytearray()
+        for row in range(first_row, last_row):
+            _append_cells(
+                fragment, self.grid, overlay, row, first_col, last_col, self.width
+            )
+
+        fragment = bytes(fragment)
+        self._fragments[key] = fragment
+        return fragment
 
 
 # Large and clear ASCII patterns (11 height x 9 width) with improved spacing
@@ -356,125 +484,142 @@ ASCII_PATTERNS = {
     ],
 }
 
+# Bits per packed bitmap row: 9 pattern columns plus one padding column each side
+_MASK_STRIDE = 11
 
-def get_highlight_positions(time_str, start_row, start_col, grid_width, grid_height):
-    """Get positions to highlight for displaying time digits with improved spacing"""
-    positions = []
-    current_col = start_col
 
-    # Color scheme for different time components
-    colors = [
-        Colors.RED + Colors.BOLD,  # Hour tens
-        Colors.RED + Colors.BOLD,  # Hour units
-        Colors.YELLOW + Colors.BOLD,  # Colon
-        Colors.GREEN + Colors.BOLD,  # Minute tens
-        Colors.GREEN + Colors.BOLD,  # Minute units
-        Colors.YELLOW + Colors.BOLD,  # Colon
-        Colors.CYAN + Colors.BOLD,  # Second tens
-        Colors.CYAN + Colors.BOLD,  # Second units
-    ]
+def _pack_pattern(pattern):
+    """Pack a pattern into one int bitmap, framed by a row/column of padding"""
+    mask = 0
+    for row_idx, row in enumerate(pattern):
+        for col_idx, value in enumerate(row):
+            if value:
+                mask |= 1 << ((row_idx + 1) * _MASK_STRIDE + col_idx + 1)
+    return mask
 
-    for char_idx, char in enumerate(time_str):
-        pattern = ASCII_PATTERNS[char]
-        color = colors[char_idx]
-
-        # Process each pixel in the digit pattern
-        for row_idx in range(11):  # 11 rows tall
-            for col_idx in range(9):  # 9 columns wide
-                if pattern[row_idx][col_idx] == 1:
-                    highlight_row = start_row + row_idx
-                    highlight_col = current_col + col_idx
-
-                    # Ensure within grid bounds
-                    if (
-                        0 <= highlight_row < grid_height
-                        and 0 <= highlight_col < grid_width
-                    ):
-                        positions.append((highlight_row, highlight_col, color))
 
-        # Increased spacing between characters to prevent overlap
-        current_col += 12  # Increased from 11 to 12 for better separation
+def _dilate_mask(mask):
+    """Spread every set bit of a packed bitmap to its 8 neighbours"""
+    # The padding frame keeps shifted bits from wrapping into another row
+    grown = mask
+    for shift in (1, _MASK_STRIDE - 1, _MASK_STRIDE, _MASK_STRIDE + 1):
+        grown |= (mask << shift) | (mask >> shift)
+    return grown
 
-    return positions
 
+def _mask_offsets(mask):
+    """Get the (row, col) pattern offsets of the bits set in a packed bitmap"""
+    offsets = []
+    while mask:
+        bit = mask & -mask
+        row, col = divmod(bit.bit_length() - 1, _MASK_STRIDE)
+        offsets.append((row - 1, col - 1))
+        mask ^= bit
+    return tuple(offsets)
 
-def get_border_positions(time_str, start_row, start_col, grid_width, grid_height):
-    """Get positions for border around ASCII art with improved spacing"""
-    border_positions = []
-    current_col = start_col
-    digit_positions = set()
 
-    # First, collect all digit positions
-    for char_idx, char in enumerate(time_str):
-        pattern = ASCII_PATTERNS[char]
-        for row_idx in range(11):
-            for col_idx in range(9):
-                if pattern[row_idx][col_idx] == 1:
-                    digit_row = start_row + row_idx
-                    digit_col = current_col + col_idx
-                    if 0 <= digit_row < grid_height and 0 <= digit_col < grid_width:
-                        digit_positions.add((digit_row, digit_col))
-        current_col += 12  # Match the spacing in highlight positions
-
-    # Now find border positions
-    current_col = start_col
-    for char_idx, char in enumerate(time_str):
-        pattern = ASCII_PATTERNS[char]
+# Each pattern packed into a single int bitmap
+_GLYPH_MASKS = {
+    char: _pack_pattern(pattern) for char, pattern in ASCII_PATTERNS.items()
+}
 
-        # Find border positions around each active pixel
-        for row_idx in range(11):
-            for col_idx in range(9):
-                if pattern[row_idx][col_idx] == 1:
-                    center_row = start_row + row_idx
-                    center_col = current_col + col_idx
+# "On" pixel offsets (row, col) of each pattern, so callers skip empty pixels
+_ON_OFFSETS = {char: _mask_offsets(mask) for char, mask in _GLYPH_MASKS.items()}
 
-                    # Check surrounding positions for border
-                    for dr in [-1, 0, 1]:
-                        for dc in [-1, 0, 1]:
-                            if dr == 0 and dc == 0:
-                                continue  # Skip center pixel
+# Border offsets of each pattern; the 12-column spacing keeps glyphs apart,
+# so a glyph's border never lands on a neighbouring glyph's pixels
+_BORDER_OFFSETS = {
+    char: _mask_offsets(_dilate_mask(mask) & ~mask)
+    for char, mask in _GLYPH_MASKS.items()
+}
 
-                            border_row = center_row + dr
-                            border_col = center_col + dc
 
-                            # Check if border position is valid and not a digit pixel
-                            if (
-                                0 <= border_row < grid_height
-                                and 0 <= border_col < grid_width
-                                and (border_row, border_col) not in digit_positions
-                            ):
-                                border_positions.append((border_row, border_col))
+def _style_cells(style):
+    """Pre-encode every ASCII character wrapped in the given style"""
+    return [(style + chr(code) + Colors.RESET).encode() for code in range(128)]
+
+
+# Pre-encoded cells per style, indexed by the code of the (ASCII) grid character
+_BACKGROUND_CELLS = _style_cells(Colors.DARK_GRAY)
+_BORDER_CELLS = _style_cells(Colors.GRAY)
+_HOUR_CELLS = _style_cells(Colors.RED + Colors.BOLD)
+_COLON_CELLS = _style_cells(Colors.YELLOW + Colors.BOLD)
+_MINUTE_CELLS = _style_cells(Colors.GREEN + Colors.BOLD)
+_SECOND_CELLS = _style_cells(Colors.CYAN + Colors.BOLD)
+
+# Color scheme for the time components, indexed by position in "HH:MM:SS"
+_DIGIT_CELLS = [
+    _HOUR_CELLS,  # Hour tens
+    _HOUR_CELLS,  # Hour units
+    _COLON_CELLS,  # Colon
+    _MINUTE_CELLS,  # Minute tens
+    _MINUTE_CELLS,  # Minute units
+    _COLON_CELLS,  # Colon
+    _SECOND_CELLS,  # Second tens
+    _SECOND_CELLS,  # Second units
+]
+
+
+@functools.lru_cache(maxsize=256)
+def _place_glyph(char, slot, start_row, start_col, grid_width, grid_height):
+    """Get the clipped (position, cells) pairs of one glyph placed on the grid"""
+    placed = []
+
+    # Border pixels - lighter color for better separation
+    for row_idx, col_idx in _BORDER_OFFSETS[char]:
+        row = start_row + row_idx
+        col = start_col + col_idx
+        if 0 <= row < grid_height and 0 <= col < grid_width:
+            placed.append(((row, col), _BORDER_CELLS))
+
+    # Digit pixels
+    cells = _DIGIT_CELLS[slot]
+    for row_idx, col_idx in _ON_OFFSETS[char]:
+        row = start_row + row_idx
+        col = start_col + col_idx
+        if 0 <= row < grid_height and 0 <= col < grid_width:
+            placed.append(((row, col), cells))
+
+    return tuple(placed)
+
+
+def build_overlay(time_str, start_row, start_col, grid_width, grid_height):
+    """Map grid positions covered by the time digits and their border to cells"""
+    overlay = {}
+    current_col = start_col
 
-        current_col += 12  # Match the spacing
+    for char_idx, char in enumerate(time_str):
+        # Placements repeat every tick, only a few glyphs change per second
+        overlay.update(
+            _place_glyph(
+                char, char_idx, start_row, current_col, grid_width, grid_height
+            )
+        )
 
-    return list(set(border_positions))  # Remove duplicates
+        # Increased spacing between characters to prevent overlap
+        current_col += 12  # Increased from 11 to 12 for better separation
 
+    return overlay
 
-def display_code_with_time(grid, highlight_positions, border_positions):
+
+def _append_cells(frame, grid, overlay, row, first_col, last_col, width):
+    """Append a positioned run of one grid row's styled cells to the frame"""
+    frame += f"\033[{row + 1};{first_col + 1}H".encode()
+    offset = row * width
+    for col in range(first_col, last_col):
+        # Digit or border style, otherwise background source code
+        cells = overlay.get((row, col), _BACKGROUND_CELLS)
+        frame += cells[grid[offset + col]]
+
+
+def display_code_with_time(clock, overlay):
     """Display grid with highlighting for time and border"""
-    highlight_dict = {}
-    border_set = set(border_positions)
-
-    # Create dictionary for highlight positions
-    for row, col, color in highlight_positions:
-        if 0 <= row < len(grid) and 0 <= col < len(grid[0]):
-            highlight_dict[(row, col)] = color
-
-    # Display the grid
-    for row_idx, row in enumerate(grid):
-        line = ""
-        for col_idx, char in enumerate(row):
-            if (row_idx, col_idx) in highlight_dict:
-                # Highlighted digit pixel
-                color = highlight_dict[(row_idx, col_idx)]
-                line += color + char + Colors.RESET
-            elif (row_idx, col_idx) in border_set:
-                # Border pixel - lighter color for better separation
-                line += Colors.GRAY + char + Colors.RESET
-            else:
-                # Background source code
-                line += Colors.DARK_GRAY + char + Colors.RESET
-        print(line)
+    # Build the whole frame as bytes and write it out at once
+    frame = bytearray()
+    for row_idx in range(clock.height):
+        _append_cells(frame, clock.grid, overlay, row_idx, 0, clock.width, clock.width)
+
+    write_raw(frame)
 
 
 def display_size_warning(clock):
@@ -533,51 +678,56 @@ def display_size_warning(clock):
                 print(Colors.WHITE + centered_line + Colors.RESET)
 
 
+def sleep_until_next_second():
+    """Sleep until just past the next wall-clock second boundary"""
+    time.sleep(1.0 - (time.time() % 1.0) + 0.005)
+
+
 def main():
     """Main application entry point"""
     clock = ASCIIClock()
 
     try:
         # Setup terminal
+        Cursor.enable_ansi()
         Cursor.hide()
+        needs_clear = True
 
         while True:
+            # Without resize signals, poll the size once per tick and only
+            # rebuild the display when it actually changed
+            if not clock.supports_resize_signal:
+                clock._term_size = None
+                if clock.get_terminal_size() != clock._last_size:
+                    clock.terminal_resized = True
+
             # Check if terminal was resized or first run
-            if clock.terminal_resized or not clock.supports_resize_signal:
+            if clock.terminal_resized:
                 clock.update_display_parameters()
                 clock.terminal_resized = False
+                needs_clear = True
 
             # Check if terminal size is adequate
             if not clock.is_terminal_size_adequate():
                 display_size_warning(clock)
-                time.sleep(1)
+                needs_clear = True
+                sleep_until_next_second()
                 continue
 
-            # Calculate center position for time display with improved spacing
-            time_width = (
-                8 * 12 - 3
-            )  # 8 characters * 12 spacing - 3 for better centering
-            time_start_row = max(1, clock.height // 2 - 5)
-            time_start_col = max(5, (clock.width - time_width) // 2)
+            # Clear only after a layout change, forcing a full redraw
+            if needs_clear:
+                Cursor.clear_screen()
+                clock._drawn_time = None
+                needs_clear = False
 
-            # Get current time
+            # Skip the frame while the displayed time is still current,
+            # otherwise redraw the changed glyphs only
             current_time = time.strftime("%H:%M:%S")
+            if current_time != clock._drawn_time:
+                clock.draw_time(current_time)
 
-            # Get highlight and border positions
-            highlight_positions = get_highlight_positions(
-                current_time, time_start_row, time_start_col, clock.width, clock.height
-            )
-
-            border_positions = get_border_positions(
-                current_time, time_start_row, time_start_col, clock.width, clock.height
-            )
-
-            # Clear screen and display
-            Cursor.clear_screen()
-            display_code_with_time(clock.grid, highlight_positions, border_positions)
-
-            # Wait for next update
-            time.sleep(1)
+            # Wait for next update, aligned to the wall clock to avoid drift
+            sleep_until_next_second()
 
     except KeyboardInterrupt:
         Cursor.clear_screen()